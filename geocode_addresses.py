@@ -1,13 +1,20 @@
 import pandas as pd
-from geopy.geocoders import Nominatim
-from geopy.extra.rate_limiter import RateLimiter
-from shapely.geometry import Point
-import geopandas as gpd
 import time
 import os
+import re
 import argparse
+import csv
+import sqlite3
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import logging
+import random
 from datetime import datetime
+from functools import partial
+from urllib3.util import Retry
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".geocode_cache.sqlite")
+
 
 def setup_logging(output_folder):
     """
@@ -24,6 +31,38 @@ def setup_logging(output_folder):
         ]
     )
 
+class MinBackoffRetry(Retry):
+    """
+    urllib3 Retry whose backoff never drops below `min_backoff` seconds.
+    Stock Retry sleeps 0 s before the first retry; these retries bypass the
+    RateLimiter, so without a floor they could burst past the provider's
+    rate limit.
+    """
+
+    def __init__(self, *args, min_backoff=0, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.min_backoff = min_backoff
+
+    def new(self, **kwargs):
+        retry = super().new(**kwargs)
+        retry.min_backoff = self.min_backoff
+        return retry
+
+    def get_backoff_time(self):
+        backoff = super().get_backoff_time()
+        if backoff < self.min_backoff:
+            backoff = self.min_backoff + random.uniform(0, self.backoff_jitter)
+        return backoff
+
+def positive_int(value):
+    """
+    argparse type for integers that must be at least 1.
+    """
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
 def parse_arguments():
     """
     Parse command-line arguments.
@@ -42,11 +81,58 @@ def parse_arguments():
     )
     parser.add_argument(
         "--formats", default="GPKG",
-        help="Comma-separated list of spatial formats to export (GPKG,SHP)"
+        help="Comma-separated list of spatial formats to export (GPKG,SHP,PARQUET)"
+    )
+    parser.add_argument(
+        "--columns", default=None,
+        help="Comma-separated list of input columns to keep (default: all)"
+    )
+    parser.add_argument(
+        "--provider", default="nominatim",
+        choices=["nominatim", "mapbox", "geocodio"],
+        help="Geocoding service to use (mapbox and geocodio need --api_key)"
+    )
+    parser.add_argument(
+        "--api_key", default=os.environ.get("GEOCODER_API_KEY"),
+        help="API key for the geocoding provider (or set GEOCODER_API_KEY)"
+    )
+    parser.add_argument(
+        "--cache", default=DEFAULT_CACHE_PATH,
+        help="SQLite file caching geocode results across runs"
+    )
+    parser.add_argument(
+        "--cache_ttl_days", type=float, default=90,
+        help="Re-geocode cached addresses older than this many days"
+    )
+    parser.add_argument(
+        "--workers", type=positive_int, default=4,
+        help="Number of concurrent geocoding requests (rate limit still applies)"
     )
     return parser.parse_args()
 
 
+# Doubled commas (with any surrounding spaces) or runs of whitespace
+ADDRESS_CLEANUP_PATTERN = re.compile(r"(?P<comma>\s*,\s*,)|\s+")
+STATUS_CATEGORIES = ["Not Geocoded", "Geocoded"]
+# Addresses per worker in each threaded batch, so every worker stays busy and
+# the pool only waits for its slowest request once per batch.
+THREADED_ADDRESSES_PER_WORKER = 10
+CSV_CHUNK_ROWS = 50000
+# Export format -> (file extension, OGR driver); GeoParquet is written by pyarrow
+SPATIAL_FORMATS = {
+    "GPKG": ("gpkg", "GPKG"),
+    "SHP": ("shp", "ESRI Shapefile"),
+    "PARQUET": ("parquet", None),
+}
+CHECKPOINT_FLUSH_SECONDS = 30
+CHECKPOINT_COLUMNS = ["FULL_ADDRESS", "LAT", "LON"]
+GEOCODIO_BATCH_SIZE = 5000
+RETRY_MIN_BACKOFF_SECONDS = 2
+# Batch result for an address whose request failed (as opposed to None, which
+# means the provider found no match). Failures are retried on the next run.
+GEOCODE_FAILED = object()
+
+
 def timestamp():
     """Return a timestamp string for filenames."""
     return datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -66,38 +152,56 @@ def validate_schema(df):
 
     return df
 
-def load_data(input_path, partial_path):
+def load_data(input_path, columns=None):
     """
-    Load CSV data. Resume from partial file if it exists.
+    Load raw CSV data and add empty geocoding result columns.
+    Only the listed columns are read when `columns` is given.
     """
-    if os.path.exists(partial_path):
-        logging.info("Loading partial CSV to resume...")
-        df = pd.read_csv(partial_path)
-    else:
-        logging.info(f"Loading raw CSV: {input_path}")
-        df = pd.read_csv(input_path)
-        df["LAT"] = None
-        df["LON"] = None
-        df["STATUS"] = "Not Geocoded"
+    logging.info(f"Loading raw CSV: {input_path}")
+    df = pd.read_csv(
+        input_path,
+        engine="pyarrow",
+        dtype_backend="pyarrow",
+        usecols=columns
+    )
+    df["LAT"] = pd.Series(pd.NA, index=df.index, dtype="Float64")
+    df["LON"] = pd.Series(pd.NA, index=df.index, dtype="Float64")
+    df["STATUS"] = pd.Categorical(
+        ["Not Geocoded"] * len(df),
+        categories=STATUS_CATEGORIES
+    )
 
     return df
 
+def _cleanup_replacement(match):
+    """Replacement for ADDRESS_CLEANUP_PATTERN matches."""
+    return "," if match.lastgroup == "comma" else " "
+
+def normalize_address(address):
+    """
+    Trim, collapse whitespace and doubled commas, and title-case an address
+    in a single regex pass.
+    """
+    address = ADDRESS_CLEANUP_PATTERN.sub(_cleanup_replacement, address.strip())
+    return address.title()
+
 def clean_addresses(df):
     """
     Normalize and clean FULL_ADDRESS column.
     """
-    df["FULL_ADDRESS"] = (
-        df["FULL_ADDRESS"]
+    # Only clean addresses that are present; missing values never reach
+    # normalize_address.
+    present = df["FULL_ADDRESS"].notna()
+    cleaned = (
+        df.loc[present, "FULL_ADDRESS"]
         .astype(str)
-        .str.strip()
-        .str.replace(r"\s+", " ", regex=True)
-        .str.replace(r",\s*,", ",", regex=True)
-        .str.title()
+        .map(normalize_address, na_action="ignore")
     )
 
-    # Remove empty strings after cleaning
-    df = df[df["FULL_ADDRESS"].notna()]
-    df = df[df["FULL_ADDRESS"].str.strip() != ""]
+    # Remove missing and empty addresses in a single filter
+    keep = cleaned.index[cleaned.str.len() > 0]
+    df = df.loc[keep]
+    df["FULL_ADDRESS"] = cleaned.loc[keep].astype("string[pyarrow]")
     return df
 
 def remove_duplicates(df):
@@ -138,88 +242,388 @@ def run_validation_pipeline(df):
 
     return df
 
-def initialize_geocoder():
+def initialize_geocoder(provider="nominatim", api_key=None, workers=4):
+    """
+    Initialize the geocoding backend.
+    Returns a batch function mapping a list of addresses to (lat, lon)
+    tuples (None when unmatched, GEOCODE_FAILED on request errors), the
+    number of addresses per batch, and the provider actually used.
+    Falls back to Nominatim when the requested provider is unavailable.
+    """
+    from geopy.adapters import RequestsAdapter
+    from geopy.exc import GeocoderServiceError
+    from geopy.extra.rate_limiter import RateLimiter
+    from geopy.geocoders import MapBox, Nominatim
+
+    if provider != "nominatim" and not api_key:
+        logging.warning(f"No API key for {provider}; falling back to Nominatim.")
+        provider = "nominatim"
+
+    if provider == "geocodio":
+        try:
+            from geocodio import GeocodioClient
+        except ImportError:
+            logging.warning("pygeocodio is not installed; falling back to Nominatim.")
+            provider = "nominatim"
+        else:
+            client = GeocodioClient(api_key)
+            geocode_batch = partial(geocode_batch_geocodio, client)
+            return geocode_batch, GEOCODIO_BATCH_SIZE, provider
+
+    min_delay = 0.1 if provider == "mapbox" else 1
+
+    # Requests share a pooled keep-alive session so connections are reused.
+    # Transient errors and 429s are retried by urllib3 with jittered
+    # exponential backoff, honouring the server's Retry-After header. Every
+    # worker may retry at once, so the first wait is long enough to keep
+    # their combined retries within the rate limit.
+    retry = MinBackoffRetry(
+        total=3,
+        backoff_factor=1.0,
+        backoff_jitter=1.0,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET"]),
+        respect_retry_after_header=True,
+        min_backoff=max(RETRY_MIN_BACKOFF_SECONDS, min_delay * workers)
+    )
+    adapter_factory = partial(
+        RequestsAdapter,
+        pool_connections=workers,
+        pool_maxsize=workers * 2,
+        max_retries=retry
+    )
+
+    if provider == "mapbox":
+        geolocator = MapBox(
+            api_key=api_key,
+            timeout=10,
+            adapter_factory=adapter_factory
+        )
+    else:
+        geolocator = Nominatim(
+            user_agent="geo_project",
+            timeout=10,
+            adapter_factory=adapter_factory
+        )
+
+    # The RateLimiter is thread-safe, so the delay holds across all workers.
+    # Retries happen in the HTTP adapter, so the RateLimiter only spaces
+    # requests and lets errors through to geocode_address.
+    geocode = RateLimiter(
+        geolocator.geocode,
+        min_delay_seconds=min_delay,
+        max_retries=0,
+        swallow_exceptions=False
+    )
+    geocode_batch = partial(
+        geocode_batch_threaded,
+        geocode,
+        workers=workers,
+        service_errors=GeocoderServiceError
+    )
+    return geocode_batch, workers * THREADED_ADDRESSES_PER_WORKER, provider
+
+
+def geocode_address(geocode_func, address, service_errors=Exception):
     """
-    Initialize Nominatim geocoder with rate limiting.
+    Geocode a single address. Retries are handled by the HTTP adapter, so a
+    service error here means the request failed; GEOCODE_FAILED is returned
+    so the address is not mistaken for one with no match.
     """
-    geolocator = Nominatim(user_agent="geo_project", timeout=10)
-    geocode = RateLimiter(geolocator.geocode, min_delay_seconds=1)
-    return geocode
+    try:
+        return geocode_func(address)
+    except service_errors as e:
+        logging.error(f"Failed to geocode '{address}': {e}")
+        return GEOCODE_FAILED
 
 
-def geocode_address(geocode_func, address, max_attempts=3):
+def repair_checkpoint(partial_path, block_size=65536):
     """
-    Attempt to geocode a single address with retry logic.
+    Truncate the checkpoint back to its last complete line.
+    A run killed mid-write can leave a partial row; it would otherwise be
+    misread on resume and have the next row appended onto it.
     """
-    for attempt in range(max_attempts):
-        try:
-            location = geocode_func(address)
-            return location
-        except Exception as e:
-            logging.warning(f"Attempt {attempt + 1} failed for '{address}': {e}")
-            time.sleep(2)
+    with open(partial_path, "rb+") as f:
+        end = f.seek(0, os.SEEK_END)
+        pos = end
 
-    logging.error(f"Failed to geocode after {max_attempts} attempts: {address}")
-    return None
+        while pos > 0:
+            start = max(0, pos - block_size)
+            f.seek(start)
+            newline = f.read(pos - start).rfind(b"\n")
+            if newline != -1:
+                pos = start + newline + 1
+                break
+            pos = start
 
+        if pos != end:
+            logging.warning(f"Dropping incomplete last row from {partial_path}")
+            f.truncate(pos)
 
-def process_geocoding(df, geocode_func, partial_path):
+
+def load_checkpoint(partial_path):
     """
-    Loop through DataFrame and geocode missing addresses.
-    Saves partial progress every 10 records.
+    Load geocoded addresses from the append-only checkpoint file.
     """
-    total = len(df)
+    if not os.path.exists(partial_path):
+        return {}
 
-    for position, (idx, row) in enumerate(df.iterrows(), start=1):
+    repair_checkpoint(partial_path)
+    if os.path.getsize(partial_path) == 0:
+        return {}
 
-        if pd.notnull(row["LAT"]) and pd.notnull(row["LON"]):
-            continue
+    checkpoint = pd.read_csv(partial_path, on_bad_lines="skip")
+    checkpoint = checkpoint.dropna(subset=["LAT", "LON"])
+    cache = dict(zip(
+        checkpoint["FULL_ADDRESS"],
+        zip(checkpoint["LAT"], checkpoint["LON"])
+    ))
 
-        address = row["FULL_ADDRESS"]
-        logging.info(f"Geocoding {position}/{total}: {address}")
+    logging.info(f"Resuming with {len(cache)} geocoded addresses from {partial_path}")
+    return cache
 
-        location = geocode_address(geocode_func, address)
 
-        if location:
-            df.at[idx, "LAT"] = location.latitude
-            df.at[idx, "LON"] = location.longitude
-            df.at[idx, "STATUS"] = "Geocoded"
-        else:
-            logging.warning(f"No match found for '{address}'")
+def append_checkpoint(results, partial_path):
+    """
+    Append newly geocoded addresses to the checkpoint file.
+    Only new rows are written, so checkpointing cost stays proportional
+    to each batch rather than to the whole dataset.
+    """
+    write_header = (
+        not os.path.exists(partial_path) or os.path.getsize(partial_path) == 0
+    )
+
+    with open(partial_path, "a", newline="") as f:
+        writer = csv.writer(f)
+        if write_header:
+            writer.writerow(CHECKPOINT_COLUMNS)
+        for address, (lat, lon) in results.items():
+            writer.writerow([address, lat, lon])
 
-        if position % 10 == 0 or position == total:
-            df.to_csv(partial_path, index=False)
-            logging.info(f"Partial progress saved to {partial_path}")
 
+def apply_geocode_cache(df, cache):
+    """
+    Copy cached coordinates onto every row sharing a cached address.
+    """
+    mask = df["FULL_ADDRESS"].isin(cache) & df["LAT"].isna()
+    if mask.any():
+        lat_lookup = {address: coords[0] for address, coords in cache.items()}
+        lon_lookup = {address: coords[1] for address, coords in cache.items()}
+        addresses = df.loc[mask, "FULL_ADDRESS"]
+        df.loc[mask, "LAT"] = addresses.map(lat_lookup).to_numpy()
+        df.loc[mask, "LON"] = addresses.map(lon_lookup).to_numpy()
+        df.loc[mask, "STATUS"] = "Geocoded"
     return df
 
 
+def geocode_batch_threaded(
+    geocode_func,
+    addresses,
+    workers=4,
+    service_errors=Exception
+):
+    """
+    Geocode a batch of addresses one request at a time on a thread pool,
+    so network latency overlaps. `service_errors` are the exception types
+    treated as a failed request.
+    """
+    geocode_one = partial(
+        geocode_address,
+        geocode_func,
+        service_errors=service_errors
+    )
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        locations = list(executor.map(geocode_one, addresses))
+
+    return [
+        location if location is GEOCODE_FAILED
+        else (location.latitude, location.longitude) if location
+        else None
+        for location in locations
+    ]
+
+
+def geocode_batch_geocodio(client, addresses):
+    """
+    Geocode a batch of addresses with a single Geocodio batch request.
+    """
+    try:
+        locations = client.geocode(list(addresses))
+    except Exception as e:
+        logging.error(f"Geocodio batch request failed: {e}")
+        return [GEOCODE_FAILED] * len(addresses)
+
+    return [location.coords for location in locations]
+
+
+def open_geocode_cache(cache_path):
+    """
+    Open (and create if needed) the SQLite geocode cache shared across runs.
+    """
+    conn = sqlite3.connect(cache_path)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS geocode_results ("
+        "provider TEXT, address TEXT, lat REAL, lon REAL, cached_at REAL, "
+        "PRIMARY KEY (provider, address))"
+    )
+    return conn
+
+
+def lookup_geocode_cache(conn, provider, addresses, ttl_days):
+    """
+    Return the provider's cached results for the given addresses that are
+    newer than the TTL. Unmatched addresses are cached too and come back
+    as None.
+    """
+    cutoff = time.time() - ttl_days * 86400
+    found = {}
+
+    for address in addresses:
+        row = conn.execute(
+            "SELECT lat, lon FROM geocode_results "
+            "WHERE provider = ? AND address = ? AND cached_at >= ?",
+            (provider, address, cutoff)
+        ).fetchone()
+        if row:
+            found[address] = row if row[0] is not None else None
+
+    return found
+
+
+def store_geocode_cache(conn, provider, results):
+    """
+    Save the provider's geocode results (None for unmatched addresses) to
+    the cache. Failed requests are skipped so they are retried next run.
+    """
+    now = time.time()
+    rows = [
+        (provider, address, *(coords or (None, None)), now)
+        for address, coords in results.items()
+        if coords is not GEOCODE_FAILED
+    ]
+    with conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO geocode_results VALUES (?, ?, ?, ?, ?)",
+            rows
+        )
+
+
+def process_geocoding(
+    df,
+    geocode_batch,
+    batch_size,
+    provider,
+    partial_path,
+    cache_path,
+    cache_ttl_days=90
+):
+    """
+    Geocode each unique missing address once and map results back to all rows.
+    Addresses found in the geocode cache are reused without a request; the
+    rest are sent to the provider in batches. Results are appended to the
+    checkpoint file periodically and on exit, so interrupted runs can
+    resume.
+    """
+    cache = load_checkpoint(partial_path)
+
+    addresses = df["FULL_ADDRESS"].to_numpy()
+    missing = (df["LAT"].isna() & ~df["FULL_ADDRESS"].isin(cache)).to_numpy()
+    pending = pd.unique(addresses[missing])
+
+    with closing(open_geocode_cache(cache_path)) as cache_db:
+        cached = lookup_geocode_cache(cache_db, provider, pending, cache_ttl_days)
+        if cached:
+            logging.info(f"Found {len(cached)} addresses in geocode cache {cache_path}")
+            hits = {address: coords for address, coords in cached.items() if coords}
+            append_checkpoint(hits, partial_path)
+            cache.update(hits)
+            pending = [address for address in pending if address not in cached]
+
+        total = len(pending)
+        unsaved = {}
+        last_flush = time.monotonic()
+
+        try:
+            for start in range(0, total, batch_size):
+                batch = pending[start:start + batch_size]
+                results = geocode_batch(list(batch))
+
+                for address, coords in zip(batch, results):
+                    if coords is GEOCODE_FAILED:
+                        logging.warning(f"Geocoding failed for '{address}'; will retry next run")
+                    elif coords:
+                        unsaved[address] = coords
+                    else:
+                        logging.warning(f"No match found for '{address}'")
+
+                logging.info(f"Geocoded {start + len(batch)}/{total} addresses")
+                store_geocode_cache(cache_db, provider, dict(zip(batch, results)))
+
+                if time.monotonic() - last_flush > CHECKPOINT_FLUSH_SECONDS:
+                    append_checkpoint(unsaved, partial_path)
+                    cache.update(unsaved)
+                    unsaved = {}
+                    last_flush = time.monotonic()
+                    logging.info(f"Partial progress saved to {partial_path}")
+        finally:
+            # Also runs on Ctrl+C, so an interrupted run keeps its progress.
+            append_checkpoint(unsaved, partial_path)
+            cache.update(unsaved)
+            logging.info(f"Partial progress saved to {partial_path}")
+
+    return apply_geocode_cache(df, cache)
+
+
 def create_geodataframe(df):
     """
     Convert DataFrame to GeoDataFrame with geometry column.
     """
+    # Spatial libraries are slow to import, so load them only when needed.
+    import geopandas as gpd
+    import shapely
+
     if 'index' in df.columns:
         df = df.drop(columns=['index'])
 
-    df["geometry"] = df.apply(
-        lambda row: Point(row["LON"], row["LAT"])
-        if pd.notnull(row["LAT"]) and pd.notnull(row["LON"])
-        else None,
-        axis=1
-    )
+    # Build all points in a single shapely C call; rows without coordinates
+    # get an empty (None) geometry.
+    lat = df["LAT"].to_numpy(dtype="float64", na_value=float("nan"))
+    lon = df["LON"].to_numpy(dtype="float64", na_value=float("nan"))
+    geometry = shapely.points(lon, lat)
+    geometry[pd.isna(lat) | pd.isna(lon)] = None
 
+    # OGR has no categorical field type, so write STATUS as plain text.
     gdf = gpd.GeoDataFrame(
-        df.reset_index(drop=True),
-        geometry="geometry",
+        df.reset_index(drop=True).astype({"STATUS": "string"}),
+        geometry=geometry,
         crs="EPSG:4326"
     )
 
     return gdf
 
 
+def write_csv_atomic(df, path, chunk_rows=CSV_CHUNK_ROWS):
+    """
+    Write a DataFrame to CSV via a temporary file that is renamed into place
+    when complete, so an interrupted export never leaves a half-written
+    final CSV.
+    """
+    tmp_path = f"{path}.tmp"
+
+    try:
+        df.to_csv(tmp_path, index=False, chunksize=chunk_rows)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    os.replace(tmp_path, path)
+
+
 def save_outputs(df, gdf, output_folder, output_name, formats):
     """
-    Save final CSV and spatial outputs (GeoPackage / Shapefile) with timestamp.
+    Save final CSV and spatial outputs (GeoPackage / Shapefile / GeoParquet)
+    with timestamp.
     """
     ts = timestamp()
 
@@ -230,21 +634,39 @@ def save_outputs(df, gdf, output_folder, output_name, formats):
     # Partial CSV path
     partial_path = os.path.join(output_folder, f"{output_name}_partial.csv")
 
-    # Save final CSV
+    # Collect (label, path, writer) jobs; they are independent I/O tasks.
     final_csv_path = os.path.join(output_folder, f"{output_name}_{ts}.csv")
-    df.to_csv(final_csv_path, index=False)
-    logging.info(f"Saved final CSV to {final_csv_path}")
+    jobs = [("final CSV", final_csv_path, partial(write_csv_atomic, df))]
 
-    # Save spatial outputs
     for driver in formats:
         driver_upper = driver.strip().upper()
-        if driver_upper not in ["GPKG", "SHP"]:
+        if driver_upper not in SPATIAL_FORMATS:
             logging.info(f"Skipping unsupported format: {driver}")
             continue
-        ext = "gpkg" if driver_upper == "GPKG" else "shp"
+        ext, ogr_driver = SPATIAL_FORMATS[driver_upper]
         spatial_path = os.path.join(output_folder, f"{output_name}_{ts}.{ext}")
-        gdf.to_file(spatial_path, driver=driver_upper)
-        logging.info(f"Saved {driver_upper} file to {spatial_path}")
+        if ogr_driver is None:
+            writer = partial(gdf.to_parquet, compression="zstd")
+        else:
+            # Hand GDAL an Arrow table instead of writing feature by feature.
+            writer = partial(
+                gdf.to_file,
+                driver=ogr_driver,
+                engine="pyogrio",
+                use_arrow=True
+            )
+        jobs.append((f"{driver_upper} file", spatial_path, writer))
+
+    # Write all outputs concurrently; the spatial writers release the GIL.
+    with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+        futures = {
+            executor.submit(writer, path): (label, path)
+            for label, path, writer in jobs
+        }
+        for future in as_completed(futures):
+            label, path = futures[future]
+            future.result()
+            logging.info(f"Saved {label} to {path}")
 
     return partial_path
 
@@ -252,7 +674,17 @@ def save_outputs(df, gdf, output_folder, output_name, formats):
 def main():
     args = parse_arguments()
 
+    # Avoid defensive copies when filtering/assigning columns. Copy-on-write
+    # is always on from pandas 3, where the option is deprecated.
+    if int(pd.__version__.split(".")[0]) < 3:
+        pd.set_option("mode.copy_on_write", True)
+
     formats = [fmt.strip() for fmt in args.formats.split(",")]
+    columns = None
+    if args.columns:
+        columns = [col.strip() for col in args.columns.split(",")]
+        if "FULL_ADDRESS" not in columns:
+            columns.append("FULL_ADDRESS")
 
     if not os.path.exists(args.output_folder):
         os.makedirs(args.output_folder)
@@ -264,16 +696,27 @@ def main():
         f"{args.output_name}_partial.csv"
     )
 
-    # Load raw or partial data
-    df = load_data(args.input, partial_csv_path)
+    # Load raw data
+    df = load_data(args.input, columns)
 
-    # 🔥 NEW: Validation Stage (only if starting fresh)
-    if not os.path.exists(partial_csv_path):
-        df = run_validation_pipeline(df)
+    # Validation Stage
+    df = run_validation_pipeline(df)
 
     # Geocoding stage
-    geocode_func = initialize_geocoder()
-    df = process_geocoding(df, geocode_func, partial_csv_path)
+    geocode_batch, batch_size, provider = initialize_geocoder(
+        provider=args.provider,
+        api_key=args.api_key,
+        workers=args.workers
+    )
+    df = process_geocoding(
+        df,
+        geocode_batch,
+        batch_size,
+        provider,
+        partial_csv_path,
+        args.cache,
+        cache_ttl_days=args.cache_ttl_days
+    )
 
     # Spatial stage
     gdf = create_geodataframe(df)